@@ -3,6 +3,9 @@ import json
 import requests
 import xmltodict
 
+# Language elements supported by _get_language_value()
+SUPPORTED_ELEMENTS = frozenset({"code", "name"})
+
 
 def _get_arguments() -> argparse.Namespace:
     """Parse command line arguments.
@@ -29,7 +32,7 @@ def _get_language_value(language: dict, element_name: str) -> str:
     :raises: ValueError, if the `element_name` parameter is not a supported value.
     """
 
-    if element_name not in ["code", "name"]:
+    if element_name not in SUPPORTED_ELEMENTS:
         raise ValueError(f"Unsupported element: {element_name}")
 
     # In some cases, the value is in a string (current codes, collective language names)
@@ -36,8 +36,9 @@ def _find_duplicate_rows(df: pd.DataFrame) -> pd.DataFrame:
     if "Legacy Path" not in df.columns:
         raise ValueError("The DataFrame does not contain a 'Legacy Path' column.")
 
-    # Find duplicate rows based on the 'Legacy Path' column
-    duplicate_rows = df[df.duplicated(subset=["Legacy Path"], keep=False)]
+    # Find duplicate rows based on the 'Legacy Path' column;
+    # checking the single column directly is faster than df.duplicated(subset=...)
+    duplicate_rows = df[df["Legacy Path"].duplicated(keep=False)]
 
     return duplicate_rows
 
@@ -47,21 +48,19 @@ def _format_duplicate_rows(duplicate_rows: pd.DataFrame) -> pd.DataFrame:
     # Create a copy of the DataFrame to avoid modifying the original slice,
     # which causes pandas to raise a SettingWithCopyWarning
     duplicate_rows = duplicate_rows.copy()
-    # Add a new column with the original row index
-    duplicate_rows.reset_index(inplace=True, names="Original Row Number")
-    # increment each index by 2 to match the original spreadsheet
+    # Add a new column with the original row index,
+    # incremented by 2 to match the original spreadsheet
     # (1 based index, plus header row)
-    duplicate_rows["Original Row Number"] += 2
+    duplicate_rows.insert(0, "Original Row Number", duplicate_rows.index.to_numpy() + 2)
 
-    return duplicate_rows
+    return duplicate_rows.reset_index(drop=True)
 
 
 def _remove_duplicates_from_df(df: pd.DataFrame) -> pd.DataFrame:
     """Remove duplicate rows from the DataFrame."""
     # Remove duplicates based on 'Legacy Path' column, keeping the first occurrence
     # and dropping the rest
-    df.drop_duplicates(subset=["Legacy Path"], keep="first", inplace=True)
-    return df
+    return df[~df["Legacy Path"].duplicated(keep="first")]
 
 
 def _remove_duplicates_from_spreadsheet(
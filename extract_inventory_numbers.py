@@ -35,27 +35,31 @@ def _compile_regex() -> re.Pattern:
     return re.compile(''.join(regex_components))
 
 
+# Compile the pattern once, at import
+INVENTORY_NUMBER_PATTERN = _compile_regex()
+
+# NOTE: hard-coding a list of known false positives here
+# i.e. strings that match pattern but are known to not be actual inv #s
+# this could be made into a script argument later
+KNOWN_FALSE_POSITIVES = ["T01"]
+
+
 def _extract_inventory_numbers(
         value: str,
-        inventory_number_pattern: re.Pattern = _compile_regex()
+        inventory_number_pattern: re.Pattern = INVENTORY_NUMBER_PATTERN
 ) -> str:
     """Returns a pipe-delimited list of matches against provided pattern."""
     if not isinstance(value, str):
         return
 
-    matches = re.findall(inventory_number_pattern, value)
+    matches = inventory_number_pattern.findall(value)
     if matches:
         # uses dict.fromkeys() to get unique values
         # while maintaining list order
         unique_inventory_numbers = list(dict.fromkeys(matches))
 
-        # NOTE: hard-coding a list of known false positives here
-        # i.e. strings that match pattern but are known to not be actual inv #s
-        # this could be made into a script argument later
-        #
-        # if such values exist in list of unique inv #s, remove them
-        known_false_positives = ["T01"]
-        for false_positive in known_false_positives:
+        # if known false positives exist in list of unique inv #s, remove them
+        for false_positive in KNOWN_FALSE_POSITIVES:
             if false_positive in unique_inventory_numbers:
                 unique_inventory_numbers.remove(false_positive)
 
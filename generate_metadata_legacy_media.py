@@ -13,6 +13,7 @@ from utils import alma_utils, generate_metadata_utils as gm_utils
 
 # For type hints
 from fmrest.record import Record as FM_Record
+from pymarc import Record as Pymarc_Record
 
 # Module-level logger used throughout this module.
 # Handlers are configured explicitly via `configure_logging`.
@@ -86,11 +87,20 @@ def _get_metadata_records(
     # to avoid loading it in the package for each record
     nlp_model = spacy.load("en_core_web_md")
 
+    # Batches often have several Digital Data records with the same inventory number,
+    # so fetch the FileMaker and Alma records for each inventory number only once.
+    filemaker_records: dict[str, FM_Record | None] = {}
+    bib_records: dict[str, Pymarc_Record | None] = {}
+
     for digital_data_record in digital_data_records:
         # Use inventory number to find corresponding FM record and possibly Alma record
         inventory_number = digital_data_record["inventory_number"]
 
-        filemaker_record = _get_filemaker_record(inventory_number, filemaker_client)
+        if inventory_number not in filemaker_records:
+            filemaker_records[inventory_number] = _get_filemaker_record(
+                inventory_number, filemaker_client
+            )
+        filemaker_record = filemaker_records[inventory_number]
         # Metadata output requires DD-FM match at minimum,
         # so log an error and skip the current DD record if no FM record is found.
         if not filemaker_record:
@@ -101,9 +111,13 @@ def _get_metadata_records(
             )
             continue  # skip to next DD record
 
-        bib_record = alma_utils.get_alma_bib_record_with_possible_suffix(
-            inventory_number, alma_sru_client, LOGGER
-        )
+        if inventory_number not in bib_records:
+            bib_records[inventory_number] = (
+                alma_utils.get_alma_bib_record_with_possible_suffix(
+                    inventory_number, alma_sru_client, LOGGER
+                )
+            )
+        bib_record = bib_records[inventory_number]
         # Missing Alma record is OK, so log a warning and proceed with batch
         if not bib_record:
             LOGGER.warning(
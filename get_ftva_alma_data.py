@@ -8,7 +8,7 @@ from collections import Counter
 from csv import DictWriter
 from datetime import datetime
 from pathlib import Path
-from pymarc import MARCReader, Record
+from pymarc import Field, MARCReader, Record
 from pprint import pprint  # TODO: Remove after debugging
 from spacy_utils import train_model
 
@@ -31,6 +31,11 @@ def _get_args() -> argparse.Namespace:
         help="Path to file of corrected names for training spacy",
         required=False,
     )
+    parser.add_argument(
+        "--training_cache_dir",
+        help="Directory for caching parsed training data, to skip re-parsing on reruns",
+        required=False,
+    )
     parser.add_argument(
         "--dump_criteria",
         help="Dump all assigned criteria for each record to all_criteria.txt, for debugging",
@@ -68,44 +73,64 @@ def _get_logger(name: str | None = None) -> logging.Logger:
     return logger
 
 
-def _get_bib_id(record: Record) -> str:
-    """Returns the bibliographic id of the MARC record."""
-    fld = record.get("001")
-    if fld:
-        bib_id = fld.data
+def _get_bib_id(fields_by_tag: dict[str, list[Field]]) -> str:
+    """Returns the bibliographic id of the MARC record, from its fields
+    as grouped by _get_fields_by_tag().
+    """
+    flds = fields_by_tag.get("001")
+    if flds:
+        bib_id = flds[0].data
     else:
         bib_id = None
     return bib_id
 
 
-def _get_language(record: Record) -> str:
-    """Returns the primary language code of the MARC record."""
-    fld = record.get("008")
-    if fld:
-        language = fld.data[35:38]
+def _get_language(fields_by_tag: dict[str, list[Field]]) -> str:
+    """Returns the primary language code of the MARC record, from its fields
+    as grouped by _get_fields_by_tag().
+    """
+    flds = fields_by_tag.get("008")
+    if flds:
+        language = flds[0].data[35:38]
     else:
         language = "###"
     return language
 
 
-def _get_subfields(record: Record, field_tag: str, subfield_code: str) -> list:
-    """Returns a list of subfield values from the MARC record.
+def _get_fields_by_tag(record: Record) -> dict[str, list[Field]]:
+    """Returns all fields of the MARC record, grouped by tag, in record order.
+    Built in a single pass over the record, so that each later lookup by tag
+    does not have to scan all of the record's fields.
+    """
+    fields_by_tag: dict[str, list[Field]] = {}
+    for field in record:
+        fields_by_tag.setdefault(field.tag, []).append(field)
+    return fields_by_tag
+
+
+def _get_subfields(
+    fields_by_tag: dict[str, list[Field]], field_tag: str, subfield_code: str
+) -> list:
+    """Returns a list of subfield values from a MARC record's fields,
+    as grouped by _get_fields_by_tag().
     field_tag may represent a repeatable field, so get all instances.
     subfield_code may be repeated within each field, or occur just once per field.
     Does not maintain the specific field:subfield relationship.
     """
     subfields = []
-    fields = record.get_fields(field_tag)
+    fields = fields_by_tag.get(field_tag, [])
     for field in fields:
         subfields.extend(field.get_subfields(subfield_code))
     return subfields
 
 
-def _get_single_subfield(record: Record, field_tag: str, subfield_code: str) -> list:
+def _get_single_subfield(
+    fields_by_tag: dict[str, list[Field]], field_tag: str, subfield_code: str
+) -> list:
     """Returns just the first subfield of any found, as a list to keep a consistent
     interface with _get_subfields().
     """
-    subfields = _get_subfields(record, field_tag, subfield_code)
+    subfields = _get_subfields(fields_by_tag, field_tag, subfield_code)
     if subfields:
         return [subfields[0]]
     else:
@@ -116,20 +141,22 @@ def _get_field_data(record: Record) -> dict:
     """Returns a dictionary of specific data from the MARC bib record. Currently
     this is only what's needed for evaluating criteria for categorization.
     """
-    bib_id = _get_bib_id(record)
-    language = _get_language(record)
+    # Group fields by tag once, for all of the lookups below
+    fields_by_tag = _get_fields_by_tag(record)
+    bib_id = _get_bib_id(fields_by_tag)
+    language = _get_language(fields_by_tag)
     # 245 is not repeatable; 245 $a and $c are not repeatable, but 245 $p is.
-    f245a = _get_single_subfield(record, "245", "a")
-    f245c = _get_single_subfield(record, "245", "c")
-    f245n = _get_subfields(record, "245", "n")
-    f245p = _get_subfields(record, "245", "p")
+    f245a = _get_single_subfield(fields_by_tag, "245", "a")
+    f245c = _get_single_subfield(fields_by_tag, "245", "c")
+    f245n = _get_subfields(fields_by_tag, "245", "n")
+    f245p = _get_subfields(fields_by_tag, "245", "p")
     # 246 is repeatable, though 246 $a is not
-    f246a = _get_subfields(record, "246", "a")
+    f246a = _get_subfields(fields_by_tag, "246", "a")
     # 250 is repeatable, though 250 $a is not
-    f250a = _get_subfields(record, "250", "a")
+    f250a = _get_subfields(fields_by_tag, "250", "a")
     # 505 is repeatable; 505 $a is not, but 505 $r is
-    f505a = _get_subfields(record, "505", "a")
-    f505r = _get_subfields(record, "505", "r")
+    f505a = _get_subfields(fields_by_tag, "505", "a")
+    f505r = _get_subfields(fields_by_tag, "505", "r")
     field_data = {
         "bib_id": bib_id,
         "language": language,
@@ -471,26 +498,30 @@ def get_mams_json(record: dict) -> dict:
     # Comments for each element:
     # tag_no:subfield_code:field_repeatable:subfield_repeatable (within each field).
     # Source: https://www.loc.gov/marc/bibliographic/
+    fields_by_tag = _get_fields_by_tag(bib_record)
 
     # 245:a:N:N
-    title = _get_single_subfield(bib_record, "245", "a")
+    title = _get_single_subfield(fields_by_tag, "245", "a")
     # 246:a:Y:N
-    alternative_titles = _get_subfields(bib_record, "246", "a")
+    alternative_titles = _get_subfields(fields_by_tag, "246", "a")
     # 245:p:N:Y
-    episode_titles = _get_subfields(bib_record, "245", "p")
+    episode_titles = _get_subfields(fields_by_tag, "245", "p")
     # 245:a:N:N SAME AS TITLE
-    series_title = _get_single_subfield(bib_record, "245", "a")
+    series_title = _get_single_subfield(fields_by_tag, "245", "a")
     # 490 and/or 830 (no other spec given)
     # 490 and 830 are both repeatable; subfields vary
-    subseries_titles = [fld.value() for fld in bib_record.get_fields("490", "830")]
+    # Filter the record itself, rather than the index, to keep the fields in record order
+    subseries_titles = [
+        fld.value() for fld in bib_record.fields if fld.tag in ("490", "830")
+    ]
     # 245:n:N:Y
-    episode_numbers_245 = _get_subfields(bib_record, "245", "n")
+    episode_numbers_245 = _get_subfields(fields_by_tag, "245", "n")
     # 246:n:Y:Y
-    episode_numbers_246 = _get_subfields(bib_record, "246", "n")
+    episode_numbers_246 = _get_subfields(fields_by_tag, "246", "n")
     # From 008, already obtained
     language = record["language"]
     # 041 (no other spec given); repeatable, with many repeatable subfields
-    language_other = [fld.value() for fld in bib_record.get_fields("041")]
+    language_other = [fld.value() for fld in fields_by_tag.get("041", [])]
     # Already obtained from 245 $c and possibly $p; flatten into single list
     directors = [name for lst in record["directors"].values() for name in lst]
     # broadcast_date: too broadly defined
@@ -524,7 +555,7 @@ def main() -> None:
     model = spacy.load("en_core_web_md")
     # Apply our local changes, if requested.
     if args.training_file:
-        model = train_model(args.training_file, model)
+        model = train_model(args.training_file, model, args.training_cache_dir)
 
     # Get all the Alma data we'll need from MARC input file,
     # using the spacy model to identify personal names.
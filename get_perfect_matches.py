@@ -113,7 +113,7 @@ def _get_singletons(data: list[dict]) -> set[str]:
     :raises KeyError: if any dictionary does not have an `inventory_number` key.
     """
     # Get number of times each inventory number occurs.
-    counts = Counter([row["inventory_number"] for row in data])
+    counts = Counter(row["inventory_number"] for row in data)
     # Uniqueness guaranteed by count == 1, but use set for much faster lookups in next step.
     singletons = {
         inventory_number for inventory_number, count in counts.items() if count == 1
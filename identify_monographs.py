@@ -1,5 +1,4 @@
 import argparse
-from get_ftva_alma_data import _get_subfields
 import json
 import csv
 import pymarc
@@ -8,6 +7,44 @@ from datetime import datetime
 from pathlib import Path
 from pymarc import Record
 
+# FileMaker production types indicating a non-monograph record, lowercase
+NON_MONOGRAPH_PRODUCTION_TYPES_LOWERCASE = (
+    "television series",
+    "compilation",
+    "mini-series",
+    "news",
+    "newsreel",
+    "serials",
+)
+
+# FileMaker production types indicating a monograph record
+MONOGRAPH_PRODUCTION_TYPES = (
+    "ADVERTISING",
+    "ANIMATION",
+    "ANTHOLOGIES",
+    "CARTOONS",
+    "COMMERCIALS",
+    "DEMO REELS AND TAPES",
+    "DOCUMENTARY",
+    "EDUCATIONAL",
+    "FEATURE FILM",
+    "HOME MOVIES",
+    "MADE FOR TV MOVIE",
+    "MUSIC VIDEO",
+    "SHORT",
+    "SPECIALS",
+    "STUDENT",
+    "TITLES, BKGD, Outs",
+    "TRAILERS AND PROMOS",
+    "Trims and Outs",
+    "UNEDITED FOOTAGE",
+    "VARIETY",
+)
+# Paired with lowercase versions, computed once, for case-insensitive matching
+MONOGRAPH_PRODUCTION_TYPES_WITH_LOWERCASE = tuple(
+    (type, type.lower()) for type in MONOGRAPH_PRODUCTION_TYPES
+)
+
 
 def _get_args() -> argparse.Namespace:
     """Returns the command-line arguments for this program."""
@@ -70,18 +107,13 @@ def _has_non_monograph_fm_production_type(fm_record: dict) -> bool:
     Given a FileMaker record, checks whether the record has a production type value
     indicating a non-monograph type. Returns True if it does, False if it does not.
     """
-    non_monograph_types_lowercase = [
-        "television series",
-        "compilation",
-        "mini-series",
-        "news",
-        "newsreel",
-        "serials",
-    ]
     production_types = fm_record["production_type"]
-    # check if any of the non-monograph types, in any case, are in the production types string
+    # check if any of the non-monograph types, in any case, are in the production types string;
+    # lowercase the string only once, and stop at the first match
+    production_types_lowercase = production_types.lower()
     if any(
-        [type in production_types.lower() for type in non_monograph_types_lowercase]
+        type in production_types_lowercase
+        for type in NON_MONOGRAPH_PRODUCTION_TYPES_LOWERCASE
     ):
         logger.debug(
             f"Non-monograph production type found. "
@@ -94,33 +126,11 @@ def _has_non_monograph_fm_production_type(fm_record: dict) -> bool:
 
 def _get_fm_monograph_production_types(fm_record: dict) -> list:
     """Given a FileMaker record, returns a list of production types that are monograph types."""
-    monograph_types = [
-        "ADVERTISING",
-        "ANIMATION",
-        "ANTHOLOGIES",
-        "CARTOONS",
-        "COMMERCIALS",
-        "DEMO REELS AND TAPES",
-        "DOCUMENTARY",
-        "EDUCATIONAL",
-        "FEATURE FILM",
-        "HOME MOVIES",
-        "MADE FOR TV MOVIE",
-        "MUSIC VIDEO",
-        "SHORT",
-        "SPECIALS",
-        "STUDENT",
-        "TITLES, BKGD, Outs",
-        "TRAILERS AND PROMOS",
-        "Trims and Outs",
-        "UNEDITED FOOTAGE",
-        "VARIETY",
-    ]
-    production_types = fm_record["production_type"]
+    production_types_lowercase = fm_record["production_type"].lower()
     monograph_production_types = []
-    for type in monograph_types:
+    for type, type_lowercase in MONOGRAPH_PRODUCTION_TYPES_WITH_LOWERCASE:
         # check if the monograph type is in the production types string, ignoring case
-        if type.lower() in production_types.lower():
+        if type_lowercase in production_types_lowercase:
             monograph_production_types.append(type)
     logger.debug(
         f"Monograph production types for inventory number {fm_record['inventory_no']}: "
@@ -181,7 +191,11 @@ def _has_non_monograph_alma_form(marc_record: Record) -> bool:
         "Film serials",
         "Animated television programs",
     ]
-    forms = _get_subfields(marc_record, "655", "a")
+    forms = [
+        form
+        for field in marc_record.get_fields("655")
+        for form in field.get_subfields("a")
+    ]
     for form in forms:
         if form in non_monograph_forms:
             logger.debug(
@@ -426,19 +426,21 @@ def report_multiple_values(
 
     for compound_value in google_multiple_values:
         matches = _get_many_to_many_matches(compound_value, alma_data, filemaker_data)
+        # Inventory numbers which match multiple records (in FM and/or Alma).
+        multiple_matches = [
+            match
+            for match in matches
+            if match.alma_count > 1 or match.filemaker_count > 1
+        ]
         # Case 1: Does each inventory number match only one record (in FM or Alma)?
-        if all([match.total_count == 1 for match in matches]):
+        # Uses a generator, so checking stops at the first failure.
+        if all(match.total_count == 1 for match in matches):
             # Add all of the matches for reporting.
             each_to_one_fm_or_alma.extend(matches)
         # Case 2: Does at least one inventory number match multiple records (in FM and/or Alma)?
-        elif any(
-            [(match.alma_count > 1 or match.filemaker_count > 1) for match in matches]
-        ):
+        elif multiple_matches:
             # Add only the qualifying matches for reporting.
-            # The test is repeated, but this is quick enough and I don't see a better way...
-            for match in matches:
-                if match.alma_count > 1 or match.filemaker_count > 1:
-                    at_least_one_to_mult_fm_or_alma.append(match)
+            at_least_one_to_mult_fm_or_alma.extend(multiple_matches)
         else:
             # Not a reportable case, but capture for possible use / debugging.
             leftovers.extend(matches)
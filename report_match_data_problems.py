@@ -1,16 +1,50 @@
 import json
+import functools
 import csv
 import tomllib
 import argparse
 import logging
 from pathlib import Path
 from strsimpy.normalized_levenshtein import NormalizedLevenshtein
-from pymarc import Record
+from pymarc import Field, Record
 from datetime import datetime, timedelta
 from ftva_etl.metadata.marc import _get_date_from_bib
 from ftva_etl.metadata.utils import strip_whitespace_and_punctuation
 from alma_api_client import AlmaAPIClient, BibRecord
 
+# Shared NormalizedLevenshtein instance, constructed once per program run
+LEVENSHTEIN = NormalizedLevenshtein()
+
+# Output columns for CSV report, in order.
+OUTPUT_FIELDNAMES = [
+    "Alma bib id",
+    "FileMaker Record ID",
+    "Digital Data Inventory Number",
+    "No 008 field",
+    "Invalid language",
+    "No 26x date",
+    "Lacks attribution phrase",
+    "Title match score",
+    "Alma title",
+    "Filemaker title",
+    "Check 245 indicator 2",
+]
+
+# Leading English articles in titles, lowercase, with trailing space
+ENGLISH_ARTICLES = ("a ", "an ", "the ")
+
+# MARC fields used by the data match checks, collected in one pass over each record
+NEEDED_TAGS = frozenset({"001", "008", "245"})
+
+# Phrases in 245 $c which count as a relevant statement of responsibility
+ATTRIBUTION_PHRASES = (
+    "directed by",
+    "director",
+    "directors",
+    "a film by",
+    "supervised by",
+)
+
 
 def _get_arguments() -> argparse.Namespace:
     """Parse command line arguments.
@@ -140,45 +174,62 @@ def data_is_recent(digital_data_filename: str, filemaker_filename: str) -> bool:
     return False
 
 
-def has_no_008(record: Record) -> str:
+def _extract_needed_fields(record: Record) -> dict[str, Field]:
+    """Collect the first instance of each field in NEEDED_TAGS from a MARC record,
+    iterating over the record's fields only once.
+
+    :param record: The MARC record to extract fields from.
+    :return: Dict mapping tag to the first field with that tag. Tags not found
+    in the record are not included.
+    """
+
+    needed_fields = {}
+    for field in record:
+        if field.tag in NEEDED_TAGS and field.tag not in needed_fields:
+            needed_fields[field.tag] = field
+    return needed_fields
+
+
+def has_no_008(field_008: Field | None) -> str:
     """Check if a MARC record has no 008 field.
 
-    :param record: The MARC record to check.
+    :param field_008: The 008 field of the MARC record to check, or None if absent.
     :return: "Yes" if the record has no 008 field, empty string otherwise.
     """
 
-    field_008 = record.get_fields("008")
     if not field_008:
         return "Yes"
     return ""
 
 
-def invalid_language(record: Record, valid_language_codes: set[str]) -> str:
+def invalid_language(
+    field_008: Field | None, valid_language_codes: frozenset[str]
+) -> str:
     """Check if a MARC record has an invalid language code in field 008.
 
-    :param record: The MARC record to check.
+    :param field_008: The 008 field of the MARC record to check, or None if absent.
+    :param valid_language_codes: Set of valid language codes.
     :return: String representing the invalid language code status. "BLANK" if blank,
     "TOO SHORT" if too short, the invalid code itself if invalid, empty string otherwise.
     """
 
-    field_008 = record.get_fields("008")
     if not field_008:
         return ""
 
     # Safely get the raw 008 data; Field.data may be None or shorter than expected.
-    raw_data = getattr(field_008[0], "data", "") or ""
+    raw_data = getattr(field_008, "data", "") or ""
     if len(raw_data) < 38:
         # If the field is entirely blank or only whitespace, treat as BLANK,
         # otherwise treat as TOO SHORT so callers can distinguish.
-        if raw_data.strip() == "":
+        # isspace() avoids allocating a stripped copy of the data.
+        if not raw_data or raw_data.isspace():
             return "BLANK"
         return "TOO SHORT"
 
+    # Data is at least 38 characters here, so the code is always 3 characters.
     lang_code = raw_data[35:38]
     if lang_code == "   ":
         return "BLANK"
-    elif len(lang_code) < 3:
-        return "TOO SHORT"
     if lang_code not in valid_language_codes:
         return lang_code
     return ""
@@ -198,65 +249,94 @@ def no_26x_date(record: Record) -> str:
     return ""
 
 
-def lacks_attribution_phrase(record: Record) -> str:
-    """Check if a MARC record lacks a relevant statement of responsibility in 245 $c.
+def lacks_attribution_phrase(field_245: Field | None) -> str:
+    """Check if a MARC 245 field lacks a relevant statement of responsibility in $c.
 
-    :param record: The MARC record to check.
+    :param field_245: The 245 field of the MARC record to check, or None if absent.
     :return: "Yes" if no relevant attribution phrase is found, empty string otherwise.
     """
 
-    field_245 = record.get("245")  # only one 245 field per record
     if not field_245:
         return "Yes"
-    attribution_phrases = [
-        "directed by",
-        "director",
-        "directors",
-        "a film by",
-        "supervised by",
-    ]
     subfield_c = field_245.get_subfields("c")
     if not subfield_c:
         return "Yes"
-    for phrase in attribution_phrases:
-        if phrase in subfield_c[0].lower():  # $c is not repeatable
-            return ""
+    statement = subfield_c[0].lower()  # $c is not repeatable
+    if any(phrase in statement for phrase in ATTRIBUTION_PHRASES):
+        return ""
     return "Yes"
 
 
-def get_alma_title(record: Record) -> tuple[str, bool]:
-    """Construct title from MARC record fields 245 $a, $b, $n, and $p,
-    removing trailing punctuation and whitespace from each field,
-    and moving leading articles to the end of 245 $a.
+@functools.lru_cache(maxsize=4096)
+def _rearrange_title(main_title: str, non_filing_chars: int | None) -> tuple[str, bool]:
+    """Move the leading article of a title (245 $a) to the end of the title.
+    Results are cached, since the same titles recur across many records.
 
-    :param record: The MARC record to extract the title from.
-    :return: A tuple containing the normalized title string and a boolean indicating
+    :param main_title: The title to rearrange, already stripped of punctuation.
+    :param non_filing_chars: Number of non-filing characters from 245 indicator 2,
+    or None if the indicator is not a valid integer.
+    :return: A tuple containing the rearranged title and a boolean indicating
     whether 245 indicator 2 needs to be checked.
     """
 
-    # Some scope-specific helper functions
-    def _starts_with_article(title: str, articles: tuple[str, ...]) -> str | None:
-        """Check if a title starts with any of the given articles,
-        in a case-insensitive manner,
-        and return the article if found, otherwise None.
-        """
-        for article in articles:
-            if title.lower().startswith(article):
-                return article
-        return None
-
     def _move_article_to_end(title: str, article_offset: int) -> str:
         """Move the article at the given offset to the end of the title."""
         leading_article = title[:article_offset].strip()
         title = title[article_offset:].strip()
         return f"{title}, {leading_article}"
 
+    # Flags for use below
+    check_245_indicator_2 = False
+    # Check for English articles in a case-insensitive manner
+    main_title_lower = main_title.lower()
+    starting_article = None
+    for article in ENGLISH_ARTICLES:
+        if main_title_lower.startswith(article):
+            starting_article = article
+            break
+
+    if starting_article and non_filing_chars:
+        # Make sure title is long enough for article to be moved
+        if len(main_title) > non_filing_chars:
+            # If non_filing_chars does not match article length,
+            # set check_245_indicator_2 to True.
+            # This catches the case where non_filing_chars is 0,
+            # as that is an integer, but not a possible article length.
+            if non_filing_chars != len(starting_article):
+                check_245_indicator_2 = True
+            # Can use article length regardless,
+            # since if non_filing_chars == len(starting_article),
+            # it doesn't matter which length is used.
+            main_title = _move_article_to_end(main_title, len(starting_article))
+    # If non_filing_chars can't be coerced to an integer,
+    # but there is an English article, set check_245_indicator_2 to True
+    # and move the article using the article length.
+    elif starting_article and not non_filing_chars:
+        check_245_indicator_2 = True
+        main_title = _move_article_to_end(main_title, len(starting_article))
+    # If no English article and non_filing_chars is a non-zero integer,
+    # move the article using the non_filing_chars value.
+    elif not starting_article and non_filing_chars:
+        main_title = _move_article_to_end(main_title, non_filing_chars)
+
+    return main_title, check_245_indicator_2
+
+
+def get_alma_title(field_245: Field | None) -> tuple[str, bool]:
+    """Construct title from MARC record fields 245 $a, $b, $n, and $p,
+    removing trailing punctuation and whitespace from each field,
+    and moving leading articles to the end of 245 $a.
+
+    :param field_245: The 245 field of the MARC record, or None if absent.
+    :return: A tuple containing the normalized title string and a boolean indicating
+    whether 245 indicator 2 needs to be checked.
+    """
+
     def _get_first_stripped(subfields: list[str]) -> str:
         """Get the first stripped subfield from the given list of subfields."""
         stripped = strip_whitespace_and_punctuation(subfields)
         return stripped[0] if stripped else ""
 
-    field_245 = record.get("245")
     if field_245:
         main_title = _get_first_stripped(field_245.get_subfields("a"))
         remainder_of_title = _get_first_stripped(field_245.get_subfields("b"))
@@ -275,34 +355,9 @@ def get_alma_title(record: Record) -> tuple[str, bool]:
         except (ValueError, TypeError):
             non_filing_chars = None
 
-        # Flags for use below
-        check_245_indicator_2 = False
-        english_articles = ("a ", "an ", "the ")
-        starting_article = _starts_with_article(main_title, english_articles)
-
-        if starting_article and non_filing_chars:
-            # Make sure title is long enough for article to be moved
-            if len(main_title) > non_filing_chars:
-                # If non_filing_chars does not match article length,
-                # set check_245_indicator_2 to True.
-                # This catches the case where non_filing_chars is 0,
-                # as that is an integer, but not a possible article length.
-                if non_filing_chars != len(starting_article):
-                    check_245_indicator_2 = True
-                # Can use article length regardless,
-                # since if non_filing_chars == len(starting_article),
-                # it doesn't matter which length is used.
-                main_title = _move_article_to_end(main_title, len(starting_article))
-        # If non_filing_chars can't be coerced to an integer,
-        # but there is an English article, set check_245_indicator_2 to True
-        # and move the article using the article length.
-        elif starting_article and not non_filing_chars:
-            check_245_indicator_2 = True
-            main_title = _move_article_to_end(main_title, len(starting_article))
-        # If no English article and non_filing_chars is a non-zero integer,
-        # move the article using the non_filing_chars value.
-        elif not starting_article and non_filing_chars:
-            main_title = _move_article_to_end(main_title, non_filing_chars)
+        main_title, check_245_indicator_2 = _rearrange_title(
+            main_title, non_filing_chars
+        )
 
         # Return the normalized title, filtering out any empty strings.
         normalized_title = ". ".join(
@@ -328,19 +383,18 @@ def get_filemaker_title(fm_record: dict) -> str:
 
 
 def get_title_match_score(
-    alma_record: Record, fm_record: dict, levenshtein: NormalizedLevenshtein
+    alma_title: str, fm_record: dict, levenshtein: NormalizedLevenshtein
 ) -> float:
     """Calculate the normalized Levenshtein similarity score between
-    the title in a MARC record and a FileMaker record, using provided
+    the title from a MARC record and a FileMaker record, using provided
     NormalizedLevenshtein instance.
 
-    :param alma_record: The MARC record to extract the title from.
+    :param alma_title: The normalized title from the MARC record, via get_alma_title().
     :param fm_record: The FileMaker record dictionary.
     :param levenshtein: An instance of NormalizedLevenshtein to use for similarity calculation.
     :return: The normalized Levenshtein similarity score between the two titles.
     """
 
-    alma_title = get_alma_title(alma_record)[0]
     fm_title = get_filemaker_title(fm_record)
     if not alma_title or not fm_title:
         return 0
@@ -348,15 +402,15 @@ def get_title_match_score(
     return score
 
 
-def get_valid_language_codes() -> set[str]:
+def get_valid_language_codes() -> frozenset[str]:
     """Read the valid language codes from the language_map.json file.
 
-    :return: Set of valid language codes.
+    :return: Frozen set of valid language codes.
     """
 
     with open("language_map.json", "r", encoding="utf-8") as f:
         language_map = json.load(f)
-    return set(language_map.keys())
+    return frozenset(language_map)
 
 
 def build_inventory_index(
@@ -377,6 +431,8 @@ def build_inventory_index(
     :param call_no_suffixes: List of call number suffixes to append for variant generation
     :return: Dictionary mapping inventory number variants to their corresponding record.
     """
+    # str.startswith() accepts a tuple, checking all prefixes in a single call
+    prefixes = tuple(inv_no_prefixes)
     index = {}
     for r in records:
         value = (r.get(field) or "").strip()
@@ -388,7 +444,7 @@ def build_inventory_index(
 
         if call_no_suffixes:
             # Add suffix variants only if prefix matches known patterns
-            if any(value.startswith(prefix) for prefix in inv_no_prefixes):
+            if value.startswith(prefixes):
                 for suffix in call_no_suffixes:
                     index.setdefault(value + suffix, []).append(r)
 
@@ -432,7 +488,7 @@ def report_data_match_issues(
     alma_record: BibRecord,
     fm_record: dict,
     dd_record: dict,
-    valid_language_codes: set[str],
+    valid_language_codes: frozenset[str],
 ) -> dict:
     """Generate a list of data match issues between Alma, FileMaker, and Digital Data records.
 
@@ -444,41 +500,40 @@ def report_data_match_issues(
     """
 
     marc_record = alma_record.marc_record
-    # Safely extract Alma bib id and guard against None/missing fields
-    # (to appease type checker)
-    alma_bib_id = ""
-    if marc_record and getattr(marc_record, "get_fields", None):
-        fields_001 = marc_record.get_fields("001")
-        if fields_001:
-            field_001 = fields_001[0]
-            alma_bib_id = getattr(field_001, "data", "") or ""
-
-    # Construct NormalizedLevenshtein instance once for efficiency
-    levenshtein = NormalizedLevenshtein()
+    # Collect the fields used by the checks below in a single pass over the record.
+    needed_fields = _extract_needed_fields(marc_record) if marc_record else {}
+    field_008 = needed_fields.get("008")
+    field_245 = needed_fields.get("245")  # only one 245 field per record
+
+    # Safely extract Alma bib id, since Field.data may be None
+    field_001 = needed_fields.get("001")
+    alma_bib_id = (getattr(field_001, "data", "") or "") if field_001 else ""
+
+    # Derive the title once, for reuse by the checks below.
+    alma_title, check_245_indicator_2 = get_alma_title(field_245)
+
     data = {
         "Alma bib id": alma_bib_id,
         "FileMaker Record ID": fm_record.get("recordId", "") if fm_record else "",
         "Digital Data Inventory Number": (
             dd_record.get("inventory_number", "") if dd_record else ""
         ),
-        "No 008 field": has_no_008(marc_record) if marc_record else "",
+        "No 008 field": has_no_008(field_008) if marc_record else "",
         "Invalid language": (
-            invalid_language(marc_record, valid_language_codes) if marc_record else ""
+            invalid_language(field_008, valid_language_codes) if marc_record else ""
         ),
         "No 26x date": no_26x_date(marc_record) if marc_record else "",
         "Lacks attribution phrase": (
-            lacks_attribution_phrase(marc_record) if marc_record else ""
+            lacks_attribution_phrase(field_245) if marc_record else ""
         ),
         "Title match score": (
-            get_title_match_score(marc_record, fm_record, levenshtein)
+            get_title_match_score(alma_title, fm_record, LEVENSHTEIN)
             if marc_record and fm_record
             else 0
         ),
-        "Alma title": get_alma_title(marc_record)[0] if marc_record else "",
+        "Alma title": alma_title,
         "Filemaker title": get_filemaker_title(fm_record) if fm_record else "",
-        "Check 245 indicator 2": (
-            ("Yes" if get_alma_title(marc_record)[1] else "") if marc_record else ""
-        ),
+        "Check 245 indicator 2": "Yes" if check_245_indicator_2 else "",
     }
     return data
 
@@ -534,66 +589,54 @@ def main():
     )
     logging.info("Pre-indexed Alma and FileMaker records by inventory number variants.")
 
-    output_rows = []
+    # Write each row to the CSV as it is produced, rather than holding all rows
+    # in memory until the end.
+    row_count = 0
     seen_inventory_numbers = set()
-    for i, dd_record in enumerate(digital_data, start=1):
-
-        # Log progress every 5%
-        if i % max(1, dd_record_count // 20) == 0:
-            progress_percent = (i / dd_record_count) * 100
-            logging.info(
-                f"Processing DD records: {i}/{dd_record_count} ({progress_percent:.1f}%) completed."
-            )
-
-        # Skip records with empty inventory number
-        if dd_record.get("inventory_number", "") == "":
-            continue
-        # Skip records with an inventory number already found in output_rows
-        inv_num = dd_record.get("inventory_number", "").strip()
-        if not inv_num or inv_num in seen_inventory_numbers:
-            continue
-        seen_inventory_numbers.add(inv_num)
-
-        # Find matching FileMaker and Alma records
-        match = find_inventory_number_match(dd_record, fm_index, alma_index)
-        fm_record = match["fm_record"]
-        alma_record_dict = match["alma_record"]
-
-        # If no unique match found, skip
-        if not fm_record or not alma_record_dict:
-            continue
-
-        # Get full Record from Alma using API client
-        alma_record = alma_client.get_bib_record(alma_record_dict["MMS Id"])
-        issues = report_data_match_issues(
-            alma_record, fm_record, dd_record, valid_language_codes
-        )
-        output_rows.append(issues)
-
-    # Write output to CSV
-    output_fieldnames = [
-        "Alma bib id",
-        "FileMaker Record ID",
-        "Digital Data Inventory Number",
-        "No 008 field",
-        "Invalid language",
-        "No 26x date",
-        "Lacks attribution phrase",
-        "Title match score",
-        "Alma title",
-        "Filemaker title",
-        "Check 245 indicator 2",
-    ]
     with open(
         "data_match_issues_report.csv", "w", newline="", encoding="utf-8"
     ) as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=output_fieldnames)
-        writer.writeheader()
-        for row in output_rows:
-            writer.writerow(row)
+        writer = csv.writer(csvfile)
+        writer.writerow(OUTPUT_FIELDNAMES)
+        for i, dd_record in enumerate(digital_data, start=1):
+
+            # Log progress every 5%
+            if i % max(1, dd_record_count // 20) == 0:
+                progress_percent = (i / dd_record_count) * 100
+                logging.info(
+                    f"Processing DD records: {i}/{dd_record_count} "
+                    f"({progress_percent:.1f}%) completed."
+                )
+
+            # Skip records with empty inventory number
+            if dd_record.get("inventory_number", "") == "":
+                continue
+            # Skip records with an inventory number already written to the report
+            inv_num = dd_record.get("inventory_number", "").strip()
+            if not inv_num or inv_num in seen_inventory_numbers:
+                continue
+            seen_inventory_numbers.add(inv_num)
+
+            # Find matching FileMaker and Alma records
+            match = find_inventory_number_match(dd_record, fm_index, alma_index)
+            fm_record = match["fm_record"]
+            alma_record_dict = match["alma_record"]
+
+            # If no unique match found, skip
+            if not fm_record or not alma_record_dict:
+                continue
+
+            # Get full Record from Alma using API client
+            alma_record = alma_client.get_bib_record(alma_record_dict["MMS Id"])
+            issues = report_data_match_issues(
+                alma_record, fm_record, dd_record, valid_language_codes
+            )
+            writer.writerow([issues[fieldname] for fieldname in OUTPUT_FIELDNAMES])
+            row_count += 1
+
     logging.info(
         f"Wrote data match issues report to data_match_issues_report.csv with "
-        f"{len(output_rows)} rows."
+        f"{row_count} rows."
     )
 
 
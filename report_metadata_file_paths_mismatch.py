@@ -1,6 +1,6 @@
 import json
 import argparse
-import pandas as pd
+from openpyxl import Workbook
 from pathlib import Path
 
 
@@ -80,11 +80,18 @@ def _write_report(
     output_path = Path("output").joinpath(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)  # Make `output/` dir, if none
 
-    series_1 = pd.Series(in_file_list_not_in_metadata, name="filenames")
-    series_2 = pd.Series(in_metadata_not_in_file_list, name="filenames")
-    with pd.ExcelWriter(output_path) as writer:
-        series_1.to_excel(writer, sheet_name="file_lists_not_metadata", index=False)
-        series_2.to_excel(writer, sheet_name="metadata_not_file_lists", index=False)
+    # Write-only mode streams rows to the file, without building DataFrames
+    # or keeping all cells in memory.
+    workbook = Workbook(write_only=True)
+    for sheet_name, file_names in [
+        ("file_lists_not_metadata", in_file_list_not_in_metadata),
+        ("metadata_not_file_lists", in_metadata_not_in_file_list),
+    ]:
+        worksheet = workbook.create_sheet(sheet_name)
+        worksheet.append(["filenames"])
+        for file_name in file_names:
+            worksheet.append([file_name])
+    workbook.save(output_path)
 
 
 def main():
@@ -95,13 +102,16 @@ def main():
 
     # Filter file_lists to only include strings that end with a file extension,
     # for comparison to file names in metadata_assets.
-    file_names_in_file_lists = [
-        Path(file_path).name
-        for file_path in file_lists
+    # Names are collected directly into sets, so each is built only once
+    # for the comparisons below.
+    file_names_in_file_lists = set()
+    for file_path in file_lists:
+        path = Path(file_path)  # Parse each path only once
+        extension = path.suffix.lower()
         # Per FTVA, exclude JSON files
-        if Path(file_path).suffix and Path(file_path).suffix.lower() != ".json"
-    ]
-    file_names_in_metadata = [
+        if extension and extension != ".json":
+            file_names_in_file_lists.add(path.name)
+    file_names_in_metadata = {
         # Replace empty file names with "NO FILE NAME"
         (
             asset["file_name"]
@@ -109,16 +119,16 @@ def main():
             else f"NO FILE NAME ({asset['uuid']})"
         )
         for asset in metadata_assets
-    ]
+    }
 
     # Set A - in the file lists, but not the metadata, sorted alphabetically
     file_names_in_file_lists_not_in_metadata = sorted(
-        set(file_names_in_file_lists) - set(file_names_in_metadata)
+        file_names_in_file_lists - file_names_in_metadata
     )
 
     # Set B - in the metadata, but not the file lists, sorted alphabetically
     file_names_in_metadata_not_in_file_lists = sorted(
-        set(file_names_in_metadata) - set(file_names_in_file_lists)
+        file_names_in_metadata - file_names_in_file_lists
     )
 
     _write_report(
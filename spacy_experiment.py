@@ -9,22 +9,23 @@ from spacy.language import Language
 
 def find_names(data: list, model: Language) -> dict:
     output_dict = {}
-    for i in range(len(data)):
-        subfield_c = data[i]
-        current_names = []
-        current_other_entities = []
-        doc = model(subfield_c)
-        for ent in doc.ents:
-            if ent.label_ == "PERSON":
-                current_names.append(ent.text)
-            else:
-                current_other_entities.append(ent.text)
-        # add index to subfield_c so keys are unique
-        dict_key = f"{subfield_c} ({i})"
-        output_dict[dict_key] = {
-            "names": current_names,
-            "other_entities": current_other_entities,
-        }
+    # only entities are used, so run just the NER component, processing texts in batches
+    with model.select_pipes(enable="ner"):
+        for i, doc in enumerate(model.pipe(data)):
+            subfield_c = data[i]
+            current_names = []
+            current_other_entities = []
+            for ent in doc.ents:
+                if ent.label_ == "PERSON":
+                    current_names.append(ent.text)
+                else:
+                    current_other_entities.append(ent.text)
+            # add index to subfield_c so keys are unique
+            dict_key = f"{subfield_c} ({i})"
+            output_dict[dict_key] = {
+                "names": current_names,
+                "other_entities": current_other_entities,
+            }
 
     return output_dict
 
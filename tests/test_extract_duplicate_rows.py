@@ -99,3 +99,11 @@ class TestRemoveDuplicatesFromDf(unittest.TestCase):
     def test_remove_duplicates_from_df_no_duplicates(self):
         cleaned_df = _remove_duplicates_from_df(self.df_without_duplicates)
         pd.testing.assert_frame_equal(cleaned_df, self.df_without_duplicates)
+
+    def test_remove_duplicates_from_df_matches_drop_duplicates(self):
+        # Result should be identical to pandas' own subset-based de-duplication
+        cleaned_df = _remove_duplicates_from_df(self.df_with_duplicates)
+        expected_df = self.df_with_duplicates.drop_duplicates(
+            subset=["Legacy Path"], keep="first"
+        )
+        pd.testing.assert_frame_equal(cleaned_df, expected_df)
@@ -43,5 +43,6 @@ class TestRegEx(unittest.TestCase):
         )
 
         for input, output in test_cases:
-            inventory_numbers = _extract_inventory_numbers(input)
-            self.assertEqual(inventory_numbers, output)
+            with self.subTest(input=input):
+                inventory_numbers = _extract_inventory_numbers(input)
+                self.assertEqual(inventory_numbers, output)
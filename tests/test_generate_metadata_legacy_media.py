@@ -0,0 +1,108 @@
+import unittest
+from unittest import mock
+
+from generate_metadata_legacy_media import LOGGER, _get_metadata_records
+
+
+class TestGetMetadataRecords(unittest.TestCase):
+    def setUp(self):
+        # Several Digital Data records share each inventory number
+        self.digital_data_records = [
+            {"id": 1, "inventory_number": "INV_NO_01"},
+            {"id": 2, "inventory_number": "INV_NO_02"},
+            {"id": 3, "inventory_number": "INV_NO_01"},
+            {"id": 4, "inventory_number": "INV_NO_03"},
+            {"id": 5, "inventory_number": "INV_NO_02"},
+            {"id": 6, "inventory_number": "INV_NO_03"},
+            {"id": 7, "inventory_number": "INV_NO_01"},
+        ]
+        self.filemaker_records = {
+            "INV_NO_01": {"inventory_no": "INV_NO_01"},
+            "INV_NO_02": {"inventory_no": "INV_NO_02"},
+            # INV_NO_03 is not in FileMaker
+        }
+        self.bib_records = {
+            "INV_NO_01": "Alma bib record for INV_NO_01",
+            # INV_NO_02 is not in Alma, with or without suffixes
+        }
+
+        self.filemaker_client = mock.Mock()
+        self.filemaker_client.search_by_inventory_number.side_effect = (
+            lambda inventory_number: (
+                [self.filemaker_records[inventory_number]]
+                if inventory_number in self.filemaker_records
+                else []
+            )
+        )
+        self.alma_sru_client = mock.Mock()
+        self.alma_sru_client.search_by_call_number.side_effect = lambda inv_no: (
+            [self.bib_records[inv_no]] if inv_no in self.bib_records else []
+        )
+
+    def _get_metadata_records(self) -> tuple[list[dict], mock.Mock]:
+        with (
+            mock.patch("generate_metadata_legacy_media.spacy.load"),
+            mock.patch(
+                "generate_metadata_legacy_media.get_mams_metadata",
+                side_effect=lambda **kwargs: {
+                    "id": kwargs["digital_data_record"]["id"]
+                },
+            ) as get_mams_metadata,
+            # Search results here are already filtered
+            mock.patch(
+                "utils.alma_utils.filter_by_inventory_number_and_library",
+                side_effect=lambda records, inv_no: records,
+            ),
+            # Capture the expected warnings and errors for missing records
+            self.assertLogs(LOGGER, level="WARNING"),
+        ):
+            metadata_records = _get_metadata_records(
+                self.digital_data_records, self.alma_sru_client, self.filemaker_client
+            )
+        return metadata_records, get_mams_metadata
+
+    def test_filemaker_searched_once_per_inventory_number(self):
+        self._get_metadata_records()
+        self.assertEqual(
+            self.filemaker_client.search_by_inventory_number.call_args_list,
+            [mock.call("INV_NO_01"), mock.call("INV_NO_02"), mock.call("INV_NO_03")],
+        )
+
+    def test_alma_searched_once_per_inventory_number(self):
+        self._get_metadata_records()
+        # A miss tries each suffix once; INV_NO_03 is skipped, since it is not in FileMaker
+        self.assertEqual(
+            self.alma_sru_client.search_by_call_number.call_args_list,
+            [
+                mock.call("INV_NO_01"),
+                mock.call("INV_NO_02"),
+                mock.call("INV_NO_02T"),
+                mock.call("INV_NO_02M"),
+                mock.call("INV_NO_02R"),
+            ],
+        )
+
+    def test_records_are_reused_for_each_digital_data_record(self):
+        metadata_records, get_mams_metadata = self._get_metadata_records()
+        # Records without a FileMaker match are skipped
+        self.assertEqual(
+            metadata_records, [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 5}, {"id": 7}]
+        )
+        sources = [
+            (
+                call.kwargs["digital_data_record"]["id"],
+                call.kwargs["filemaker_record"],
+                call.kwargs["bib_record"],
+            )
+            for call in get_mams_metadata.call_args_list
+        ]
+        self.assertEqual(
+            sources,
+            [
+                (1, self.filemaker_records["INV_NO_01"], self.bib_records["INV_NO_01"]),
+                (2, self.filemaker_records["INV_NO_02"], None),
+                (3, self.filemaker_records["INV_NO_01"], self.bib_records["INV_NO_01"]),
+                (5, self.filemaker_records["INV_NO_02"], None),
+                (7, self.filemaker_records["INV_NO_01"], self.bib_records["INV_NO_01"]),
+            ],
+        )
@@ -8,12 +8,15 @@ from report_inventory_number_matches import (
 
 
 class TestInventoryNumberMatching(unittest.TestCase):
-    def setUp(self):
-        self.alma_data = self._get_alma_data()
-        self.filemaker_data = self._get_filemaker_data()
-        # self.google_data = self._get_google_data()
+    @classmethod
+    def setUpClass(cls):
+        # Tests only read this data, so build it once for the class.
+        cls.alma_data = cls._get_alma_data()
+        cls.filemaker_data = cls._get_filemaker_data()
+        # cls.google_data = cls._get_google_data()
 
-    def _get_alma_data(self) -> InventoryNumberData:
+    @staticmethod
+    def _get_alma_data() -> InventoryNumberData:
         alma_identifiers: id_dict = {
             # Used for one_to_many matches
             "INV_NO_01": ["A1"],
@@ -32,7 +35,8 @@ class TestInventoryNumberMatching(unittest.TestCase):
         )
         return alma_data
 
-    def _get_filemaker_data(self) -> InventoryNumberData:
+    @staticmethod
+    def _get_filemaker_data() -> InventoryNumberData:
         filemaker_identifiers: id_dict = {
             # Used for one_to_many matches
             "INV_NO_03": ["F1", "F2"],
@@ -1,6 +1,7 @@
 import unittest
 from pymarc import Record, Field, Indicators, Subfield
 from report_match_data_problems import (
+    _extract_needed_fields,
     has_no_008,
     invalid_language,
     no_26x_date,
@@ -8,62 +9,38 @@ from report_match_data_problems import (
     get_alma_title,
 )
 
-
-class TestReportMatchDataProblems(unittest.TestCase):
-    def setUp(self):
-        self.alma_data = self._get_alma_data()
-        self.filemaker_data = self._get_filemaker_data()
-
-    def _get_alma_data(self) -> dict[str, list]:
-        alma_data = {
-            "INV_NO_02": [  # Multiple Alma records
-                {"recordId": "A1", "marc_record": self._create_marc_record("Title A1")},
-                {"recordId": "A2", "marc_record": self._create_marc_record("Title A2")},
-            ],
-            "INV_NO_06": [  # Multiple Alma records
-                {"recordId": "A3", "marc_record": self._create_marc_record("Title A3")},
-                {"recordId": "A4", "marc_record": self._create_marc_record("Title A4")},
-            ],
-            "INV_NO_07": [  # Multiple Alma records
-                {"recordId": "A5", "marc_record": self._create_marc_record("Title A5")},
-                {"recordId": "A6", "marc_record": self._create_marc_record("Title A6")},
+# Example valid codes
+VALID_LANGUAGE_CODES = frozenset({"eng", "fre", "spa", "ger"})
+
+
+def _get_marc_record(title: str, indicator_2: str = "0") -> Record:
+    record = Record()
+    record.add_field(
+        Field(
+            tag="245",
+            indicators=Indicators("1", indicator_2),
+            subfields=[
+                Subfield("a", title),
+                Subfield("b", "Remainder of title"),
+                Subfield("n", "Number of part"),
+                Subfield("p", "Name of part"),
             ],
-        }
-        return alma_data
+        )
+    )
+    return record
 
-    def _get_filemaker_data(self) -> dict[str, list]:
-        filemaker_data = {
-            "INV_NO_03": [  # Multiple FileMaker records
-                {"recordId": "F1", "title": "Title F1"},
-                {"recordId": "F2", "title": "Title F2"},
-            ],
-            "INV_NO_05": [  # Multiple FileMaker records
-                {"recordId": "F3", "title": "Title F3"},
-                {"recordId": "F4", "title": "Title F4"},
-            ],
-            "INV_NO_07": [  # Multiple FileMaker records
-                {"recordId": "F5", "title": "Title F5"},
-                {"recordId": "F6", "title": "Title F6"},
-            ],
-        }
 
-        return filemaker_data
+class TestReportMatchDataProblems(unittest.TestCase):
+    def test_extract_needed_fields(self):
+        record = _get_marc_record("Title")
+        record.add_field(Field(tag="001", data="9912345"))
+        record.add_field(Field(tag="008", data="Some data"))
+        record.add_field(Field(tag="500", subfields=[Subfield("a", "A note")]))
 
-    def _create_marc_record(self, title: str):
-        record = Record()
-        record.add_field(
-            Field(
-                tag="245",
-                indicators=Indicators("1", "0"),
-                subfields=[
-                    Subfield("a", title),
-                    Subfield("b", "Remainder of title"),
-                    Subfield("n", "Number of part"),
-                    Subfield("p", "Name of part"),
-                ],
-            )
-        )
-        return record
+        needed_fields = _extract_needed_fields(record)
+        self.assertEqual(set(needed_fields), {"001", "008", "245"})
+        self.assertEqual(needed_fields["001"].data, "9912345")
+        self.assertEqual(needed_fields["245"].get_subfields("a"), ["Title"])
 
     def test_has_no_008(self):
         record_with_008 = Record()
@@ -71,11 +48,10 @@ class TestReportMatchDataProblems(unittest.TestCase):
 
         record_without_008 = Record()
 
-        self.assertFalse(has_no_008(record_with_008))
-        self.assertTrue(has_no_008(record_without_008))
+        self.assertFalse(has_no_008(record_with_008.get("008")))
+        self.assertTrue(has_no_008(record_without_008.get("008")))
 
     def test_invalid_language(self):
-        valid_language_codes = set(["eng", "fre", "spa", "ger"])  # Example valid codes
         record_with_valid_lang = Record()
         record_with_valid_lang.add_field(
             Field(
@@ -96,12 +72,16 @@ class TestReportMatchDataProblems(unittest.TestCase):
             )  # No lang code
         )
 
-        self.assertFalse(invalid_language(record_with_valid_lang, valid_language_codes))
+        self.assertFalse(
+            invalid_language(record_with_valid_lang.get("008"), VALID_LANGUAGE_CODES)
+        )
         self.assertTrue(
-            invalid_language(record_with_invalid_lang, valid_language_codes) == "abc"
+            invalid_language(record_with_invalid_lang.get("008"), VALID_LANGUAGE_CODES)
+            == "abc"
         )
         self.assertTrue(
-            invalid_language(record_with_no_lang, valid_language_codes) == "BLANK"
+            invalid_language(record_with_no_lang.get("008"), VALID_LANGUAGE_CODES)
+            == "BLANK"
         )
 
     def test_no_26x_date(self):
@@ -155,34 +135,18 @@ class TestReportMatchDataProblems(unittest.TestCase):
                 subfields=[Subfield("c", "A film by Jane Smith")],
             )
         )
-        self.assertFalse(lacks_attribution_phrase(record_with_directed))
-        self.assertTrue(lacks_attribution_phrase(record_without_phrase))
-        self.assertFalse(lacks_attribution_phrase(record_with_a_film_by))
+        self.assertFalse(lacks_attribution_phrase(record_with_directed.get("245")))
+        self.assertTrue(lacks_attribution_phrase(record_without_phrase.get("245")))
+        self.assertFalse(lacks_attribution_phrase(record_with_a_film_by.get("245")))
 
     def test_get_alma_title_with_leading_articles(self):
-        records = []
         articles = ["The ", "A ", "An "]
 
         for article in articles:
-            record = Record()
-            record.add_field(
-                Field(
-                    tag="245",
-                    # Indicator 2 is offset of leading article
-                    indicators=Indicators("1", str(len(article))),
-                    subfields=[
-                        Subfield("a", f"{article}main title"),
-                        Subfield("b", "Remainder of title"),
-                        Subfield("n", "Number of part"),
-                        Subfield("p", "Name of part"),
-                    ],
-                )
-            )
-            records.append((record, article))
-
-        for record, article in records:
+            # Indicator 2 is offset of leading article
+            record = _get_marc_record(f"{article}main title", str(len(article)))
             with self.subTest(record=record):
-                title, check_245_indicator_2 = get_alma_title(record)
+                title, check_245_indicator_2 = get_alma_title(record.get("245"))
                 # Leading article should be moved to end of $a
                 expected_title = (
                     f"main title, {article.strip()}. Remainder of title. "
@@ -192,20 +156,8 @@ class TestReportMatchDataProblems(unittest.TestCase):
                 self.assertFalse(check_245_indicator_2)
 
     def test_get_alma_title_without_leading_article(self):
-        record = Record()
-        record.add_field(
-            Field(
-                tag="245",
-                indicators=Indicators("1", "0"),
-                subfields=[
-                    Subfield("a", "Main title"),
-                    Subfield("b", "Remainder of title"),
-                    Subfield("n", "Number of part"),
-                    Subfield("p", "Name of part"),
-                ],
-            )
-        )
-        title, check_245_indicator_2 = get_alma_title(record)
+        record = _get_marc_record("Main title")
+        title, check_245_indicator_2 = get_alma_title(record.get("245"))
         expected_title = "Main title. Remainder of title. Number of part. Name of part"
         self.assertEqual(title, expected_title)
         self.assertFalse(check_245_indicator_2)
@@ -213,25 +165,11 @@ class TestReportMatchDataProblems(unittest.TestCase):
     def test_get_alma_title_with_bad_indicators(self):
         # Note 0 can be coerced to an integer, but is not a possible article length
         bad_indicators = ["X", "_", "", "0"]
-        records = []
         for bad_indicator in bad_indicators:
-            record = Record()
-            record.add_field(
-                Field(
-                    tag="245",
-                    indicators=Indicators("1", bad_indicator),
-                    subfields=[
-                        Subfield("a", "The main title"),  # Has leading English article
-                        Subfield("b", "Remainder of title"),
-                        Subfield("n", "Number of part"),
-                        Subfield("p", "Name of part"),
-                    ],
-                )
-            )
-            records.append(record)
-        for record in records:
+            # Has leading English article
+            record = _get_marc_record("The main title", bad_indicator)
             with self.subTest(record=record):
-                title, check_245_indicator_2 = get_alma_title(record)
+                title, check_245_indicator_2 = get_alma_title(record.get("245"))
                 # If indicator is bad, leading English articles should still be moved
                 expected_title = (
                     "main title, The. Remainder of title. Number of part. Name of part"
@@ -240,22 +178,9 @@ class TestReportMatchDataProblems(unittest.TestCase):
                 self.assertTrue(check_245_indicator_2)
 
     def test_get_alma_title_indicator_article_mismatch(self):
-        record = Record()
-        record.add_field(
-            Field(
-                tag="245",
-                indicators=Indicators(
-                    "1", "2"
-                ),  # indicator 2 is wrong length for article
-                subfields=[
-                    Subfield("a", "The main title"),
-                    Subfield("b", "Remainder of title"),
-                    Subfield("n", "Number of part"),
-                    Subfield("p", "Name of part"),
-                ],
-            )
-        )
-        title, check_245_indicator_2 = get_alma_title(record)
+        # indicator 2 is wrong length for article
+        record = _get_marc_record("The main title", "2")
+        title, check_245_indicator_2 = get_alma_title(record.get("245"))
         # Leading article should still be moved to end,
         # despite the indicator mismatch.
         expected_title = (
@@ -265,20 +190,9 @@ class TestReportMatchDataProblems(unittest.TestCase):
         self.assertTrue(check_245_indicator_2)
 
     def test_get_alma_title_non_english_article(self):
-        record = Record()
-        record.add_field(
-            Field(
-                tag="245",
-                indicators=Indicators("1", "3"),
-                subfields=[
-                    Subfield("a", "La main title"),  # Non-English article
-                    Subfield("b", "Remainder of title"),
-                    Subfield("n", "Number of part"),
-                    Subfield("p", "Name of part"),
-                ],
-            )
-        )
-        title, check_245_indicator_2 = get_alma_title(record)
+        # Non-English article
+        record = _get_marc_record("La main title", "3")
+        title, check_245_indicator_2 = get_alma_title(record.get("245"))
         # So long as it's valid, the non-filing chars should be honored,
         # even if it's not an English article
         expected_title = (
@@ -0,0 +1,122 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import spacy
+
+from utils.spacy_utils import (
+    _format_training_data,
+    _get_docbin_path,
+    _get_training_examples,
+)
+
+
+class TestFormatTrainingData(unittest.TestCase):
+    def _get_entities(self, item: list[str]) -> list[tuple]:
+        [(_, annotations)] = list(_format_training_data([item]))
+        return annotations["entities"]
+
+    def test_repeated_name_is_labelled_each_time(self):
+        entities = self._get_entities(["Jane Doe met Jane Doe.", "Jane Doe"])
+        self.assertEqual(entities, [(0, 8, "PERSON"), (13, 21, "PERSON")])
+
+    def test_longer_name_wins_over_prefix(self):
+        # "John" is a prefix of "John Smith", which should be matched as a whole
+        entities = self._get_entities(["John Smith and John", "John", "John Smith"])
+        self.assertEqual(entities, [(0, 10, "PERSON"), (15, 19, "PERSON")])
+
+    def test_blank_name_is_skipped(self):
+        entities = self._get_entities(["Directed by Jane Doe", "", "Jane Doe"])
+        self.assertEqual(entities, [(12, 20, "PERSON")])
+
+    def test_whitespace_only_name_is_skipped(self):
+        entities = self._get_entities(["Directed by  Jane Doe", "  ", "Jane Doe"])
+        self.assertEqual(entities, [(13, 21, "PERSON")])
+
+    def test_name_missing_from_text(self):
+        entities = self._get_entities(["Directed by Jane Doe", "John Smith"])
+        self.assertEqual(entities, [])
+
+    def test_text_is_unchanged(self):
+        [(text, _)] = list(_format_training_data([["Some text", "Nobody"]]))
+        self.assertEqual(text, "Some text")
+
+
+class TestGetTrainingExamples(unittest.TestCase):
+    def setUp(self):
+        self.model = spacy.blank("en")
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_path = Path(temp_dir.name)
+        self.cache_dir = str(self.temp_path / "cache")
+
+    def _write_training_file(self, relative_path: str, content: str) -> str:
+        file_path = self.temp_path / relative_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content, encoding="utf-8")
+        return str(file_path)
+
+    def _get_entities(self, examples: list) -> list[tuple]:
+        return [
+            (example.reference.text, ent.start_char, ent.end_char, ent.label_)
+            for example in examples
+            for ent in example.reference.ents
+        ]
+
+    def test_without_cache_dir_nothing_is_written(self):
+        file_path = self._write_training_file(
+            "train.txt", "A film by Jane Doe\nJane Doe\n"
+        )
+        examples = _get_training_examples(file_path, self.model)
+        self.assertEqual(
+            self._get_entities(examples), [("A film by Jane Doe", 10, 18, "PERSON")]
+        )
+        self.assertFalse(Path(self.cache_dir).exists())
+
+    def test_cache_is_built_then_reloaded(self):
+        file_path = self._write_training_file(
+            "train.txt", "A film by Jane Doe\nJane Doe\n"
+        )
+        built_examples = _get_training_examples(file_path, self.model, self.cache_dir)
+        self.assertTrue(_get_docbin_path(file_path, self.cache_dir).exists())
+
+        with mock.patch("utils.spacy_utils._build_docbin") as build_docbin:
+            loaded_examples = _get_training_examples(
+                file_path, self.model, self.cache_dir
+            )
+        build_docbin.assert_not_called()
+        self.assertEqual(
+            self._get_entities(loaded_examples), self._get_entities(built_examples)
+        )
+
+    def test_stale_cache_is_rebuilt(self):
+        file_path = self._write_training_file(
+            "train.txt", "A film by Jane Doe\nJane Doe\n"
+        )
+        _get_training_examples(file_path, self.model, self.cache_dir)
+
+        # Update the text file, and make sure it is newer than the cache
+        self._write_training_file("train.txt", "A film by Bob Jones\nBob Jones\n")
+        cache_mtime = _get_docbin_path(file_path, self.cache_dir).stat().st_mtime
+        os.utime(file_path, (cache_mtime + 10, cache_mtime + 10))
+
+        examples = _get_training_examples(file_path, self.model, self.cache_dir)
+        self.assertEqual(
+            self._get_entities(examples), [("A film by Bob Jones", 10, 19, "PERSON")]
+        )
+
+    def test_same_file_name_in_different_directories(self):
+        file_a = self._write_training_file(
+            "a/train.txt", "A film by Jane Doe\nJane Doe\n"
+        )
+        file_b = self._write_training_file(
+            "b/train.txt", "A film by Bob Jones\nBob Jones\n"
+        )
+        _get_training_examples(file_a, self.model, self.cache_dir)
+
+        examples = _get_training_examples(file_b, self.model, self.cache_dir)
+        self.assertEqual(
+            self._get_entities(examples), [("A film by Bob Jones", 10, 19, "PERSON")]
+        )
@@ -0,0 +1,47 @@
+import io
+import unittest
+from xml2json import xml_file_to_dict
+
+
+class TestXmlFileToDict(unittest.TestCase):
+    def _convert(self, xml: str) -> dict:
+        return xml_file_to_dict(io.BytesIO(xml.encode("utf-8")))
+
+    def test_repeated_sibling_tags_become_list(self):
+        data = self._convert(
+            "<root><name>One</name><name>Two</name><other>x</other></root>"
+        )
+        self.assertEqual(data, {"root": {"name": ["One", "Two"], "other": "x"}})
+
+    def test_single_child_is_not_a_list(self):
+        data = self._convert("<root><name>One</name></root>")
+        self.assertEqual(data, {"root": {"name": "One"}})
+
+    def test_attributes_on_non_leaf_element(self):
+        data = self._convert(
+            '<root version="2"><item id="1"><title>T</title></item></root>'
+        )
+        self.assertEqual(
+            data,
+            {
+                "root": {
+                    "@attributes": {"version": "2"},
+                    "item": {"@attributes": {"id": "1"}, "title": "T"},
+                }
+            },
+        )
+
+    def test_text_on_mixed_content_element(self):
+        # Only text before the first child is kept, stripped; tail text is ignored
+        data = self._convert("<root>  before <child>c</child> after</root>")
+        self.assertEqual(data, {"root": {"#text": "before", "child": "c"}})
+
+    def test_leaf_element_attributes_are_dropped(self):
+        data = self._convert(
+            '<root><title lang="en"> A title </title><empty a="1"/></root>'
+        )
+        self.assertEqual(data, {"root": {"title": "A title", "empty": None}})
+
+    def test_empty_leaf_elements_are_none(self):
+        data = self._convert("<root><empty/><blank>   </blank><empty/></root>")
+        self.assertEqual(data, {"root": {"empty": [None, None], "blank": None}})
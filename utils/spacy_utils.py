@@ -1,39 +1,135 @@
+import hashlib
+import random
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from spacy.tokens import DocBin
 from spacy.training.example import Example
 from spacy.language import Language
+from spacy.util import compounding, minibatch
 
+# Part of cached training data file names; increase it whenever
+# _format_training_data() changes, so older caches are not reused.
+TRAINING_DATA_FORMAT_VERSION = 2
 
-def _load_training_data(file_path: str) -> list:
+
+def _load_training_data(file_path: str) -> Iterator[list[str]]:
     """Load training data from a text file.
     Data is formatted as text, followed by a newline,
     followed by a list of names separated by newlines.
     Each entry is separated by two newlines.
+    The file is read line by line, yielding each entry as a list of lines,
+    so only the current entry is held in memory.
     """
     with open(file_path, encoding="utf-8") as file:
-        data = file.read().split("\n\n")
-        data = [item.split("\n") for item in data]
-
-    # Data must be in a specific format for training spacy.
-    return _format_training_data(data)
+        entry = []
+        for line in file:
+            line = line.rstrip("\n")
+            if line:
+                entry.append(line)
+            elif entry:
+                yield entry
+                entry = []
+        if entry:
+            yield entry
 
 
-def _format_training_data(data: list) -> list:
-    """Format training data for spacy."""
-    formatted_data = []
+def _format_training_data(
+    data: Iterable[list[str]],
+) -> Iterator[tuple[str, dict[str, list]]]:
+    """Format training data for spacy, yielding one formatted entry at a time."""
     for item in data:
         text = item[0]
-        entities = []
-        for name in item[1:]:
-            start = text.find(name)
-            end = start + len(name)
-            # TODO: Will this always be "PERSON", for our needs?
-            entities.append((start, end, "PERSON"))
-        formatted_data.append((text, {"entities": entities}))
-    return formatted_data
+        # Skip blank or whitespace-only lines, which would otherwise match
+        # at the start of the text, or at every run of spaces in it.
+        names = [name for name in item[1:] if name.strip()]
+        if not names:
+            yield text, {"entities": []}
+            continue
+        # Find every occurrence of every name in a single scan of the text,
+        # rather than searching the text once per name. Longer names are listed first,
+        # so they win when one name is a prefix of another.
+        pattern = re.compile(
+            "|".join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+        )
+        # TODO: Will this always be "PERSON", for our needs?
+        entities = [
+            (match.start(), match.end(), "PERSON") for match in pattern.finditer(text)
+        ]
+        yield text, {"entities": entities}
+
+
+def _build_examples(file_path: str, model: Language) -> list[Example]:
+    """Build training examples from a text file."""
+    # Data must be in a specific format for training spacy.
+    data = _format_training_data(_load_training_data(file_path))
+    return [
+        Example.from_dict(model.make_doc(text), annotations)
+        for text, annotations in data
+    ]
+
+
+def _build_docbin(file_path: str, model: Language, out_path: Path) -> list[Example]:
+    """Build training examples from a text file, and save their reference docs
+    (text with entities) to out_path in spacy's binary DocBin format,
+    so later runs can skip parsing the text file.
+    """
+    examples = _build_examples(file_path, model)
+    DocBin(docs=[example.reference for example in examples]).to_disk(out_path)
+    return examples
+
 
+def _load_docbin(docbin_path: Path, model: Language) -> list[Example]:
+    """Load training examples from reference docs saved by _build_docbin()."""
+    doc_bin = DocBin().from_disk(docbin_path)
+    return [
+        Example(model.make_doc(reference.text), reference)
+        for reference in doc_bin.get_docs(model.vocab)
+    ]
 
-def train_model(file_path: str, model: Language) -> Language:
-    """Train a spacy NER model with the given data, loaded from a text file."""
-    data = _load_training_data(file_path)
+
+def _get_docbin_path(file_path: str, cache_dir: str) -> Path:
+    """Return the path of the cached training data for a text file.
+    The name includes a hash of the text file's resolved path, so files with
+    the same name in different directories get separate caches,
+    and TRAINING_DATA_FORMAT_VERSION, so older caches are not reused.
+    """
+    source_path = Path(file_path).resolve()
+    path_hash = hashlib.sha256(str(source_path).encode("utf-8")).hexdigest()[:16]
+    return (
+        Path(cache_dir)
+        / f"{source_path.stem}.{path_hash}.v{TRAINING_DATA_FORMAT_VERSION}.spacy"
+    )
+
+
+def _get_training_examples(
+    file_path: str, model: Language, cache_dir: str | None = None
+) -> list[Example]:
+    """Get training examples from a text file.
+    If cache_dir is provided, parsed training data is cached there, in a file named
+    by _get_docbin_path(), and reused as long as the cache is newer than the text file.
+    """
+    if cache_dir is None:
+        return _build_examples(file_path, model)
+
+    docbin_path = _get_docbin_path(file_path, cache_dir)
+    if (
+        docbin_path.exists()
+        and docbin_path.stat().st_mtime >= Path(file_path).stat().st_mtime
+    ):
+        return _load_docbin(docbin_path, model)
+
+    docbin_path.parent.mkdir(parents=True, exist_ok=True)
+    return _build_docbin(file_path, model, docbin_path)
+
+
+def train_model(
+    file_path: str, model: Language, cache_dir: str | None = None
+) -> Language:
+    """Train a spacy NER model with the given data, loaded from a text file.
+    If cache_dir is provided, parsed training data is cached there for later runs.
+    """
+    examples = _get_training_examples(file_path, model, cache_dir)
 
     # set up pipeline for training
     if "ner" not in model.pipe_names:
@@ -48,8 +144,8 @@ def train_model(file_path: str, model: Language) -> Language:
         model.resume_training()
         for _ in range(10):
             losses = {}
-            for text, annotations in data:
-                doc = model.make_doc(text)
-                example = Example.from_dict(doc, annotations)
-                model.update([example], drop=0.5, losses=losses)
+            random.shuffle(examples)
+            # Update in batches of increasing size, rather than one example at a time.
+            for batch in minibatch(examples, size=compounding(4.0, 32.0, 1.001)):
+                model.update(batch, drop=0.5, losses=losses)
     return model
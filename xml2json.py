@@ -1,68 +1,106 @@
 import os
 import json
 import xml.etree.ElementTree as ET
-from glob import glob
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 
-def xml_to_dict(element):
+def xml_file_to_dict(xml_file):
     """
-    Recursively convert an XML element and its children to a dictionary.
+    Convert an XML file to a dictionary in a single streaming pass.
+    Each element is converted when it ends, merged into its parent's dictionary,
+    and then removed from its parent to free memory.
     """
-    result = {}
-    if element.attrib:
-        result["@attributes"] = element.attrib
-
-    if element.text and element.text.strip():
-        result["#text"] = element.text.strip()
-
-    children = list(element)
-    if children:
-        child_dict = {}
-        for child in children:
-            child_result = xml_to_dict(child)
-            if child.tag in child_dict:
-                if not isinstance(child_dict[child.tag], list):
-                    child_dict[child.tag] = [child_dict[child.tag]]
-                child_dict[child.tag].append(child_result[child.tag])
-            else:
-                child_dict[child.tag] = child_result[child.tag]
-        result.update(child_dict)
-    else:
-        # Set the leaf element's tag to its text content if present
-        if element.text and element.text.strip():
-            result = element.text.strip()
+    # Open elements, and their children keyed by tag; the last entry is the innermost
+    open_elements = []
+    child_dicts = []
+    for event, element in ET.iterparse(xml_file, events=("start", "end")):
+        if event == "start":
+            open_elements.append(element)
+            # Created when the first child ends, so leaf elements never allocate one
+            child_dicts.append(None)
+            continue
+
+        open_elements.pop()
+        child_dict = child_dicts.pop()
+        text = element.text.strip() if element.text else ""
+        if child_dict is None:
+            # Set the leaf element's tag to its text content if present
+            result = text or None
         else:
-            result = None
+            result = {}
+            if element.attrib:
+                result["@attributes"] = element.attrib
+            if text:
+                result["#text"] = text
+            # Children are collected in lists; a tag that occurs once keeps its single value
+            for tag, values in child_dict.items():
+                result[tag] = values[0] if len(values) == 1 else values
+
+        if not open_elements:
+            # The root element has ended
+            return {element.tag: result}
+
+        # Remove the element from its parent, to keep only open elements in memory.
+        # iterparse parses ahead, so later siblings may already be attached;
+        # remove this element itself, rather than the parent's last child.
+        open_elements[-1].remove(element)
+        if child_dicts[-1] is None:
+            child_dicts[-1] = {}
+        child_dicts[-1].setdefault(element.tag, []).append(result)
+
+
+def _convert_one(xml_file, output_folder):
+    """
+    Convert one XML file to a JSON file in the output folder.
+    Returns a tuple of the XML file, the JSON file path, and the error message, if any.
+    """
+    try:
+        data_dict = xml_file_to_dict(xml_file)
+
+        json_filename = os.path.splitext(os.path.basename(xml_file))[0] + ".json"
+        json_filepath = os.path.join(output_folder, json_filename)
 
-    return {element.tag: result}
+        with open(json_filepath, "w", encoding="utf-8") as json_file:
+            # json.dumps() can use the C encoder, which json.dump() does not
+            json_file.write(json.dumps(data_dict, indent=4, ensure_ascii=False))
+
+        return xml_file, json_filepath, None
+
+    except Exception as e:
+        # Return the message, since not every exception can be sent between processes
+        return xml_file, None, str(e)
 
 
 def convert_xml_to_json(input_folder, output_folder):
     """
     Convert all XML files in the input folder to JSON files in the output folder.
+    Files are independent, so they are converted in parallel processes.
     """
     if not os.path.exists(output_folder):
         os.makedirs(output_folder)
 
-    xml_files = glob(os.path.join(input_folder, "*.xml"))
-
-    for xml_file in xml_files:
-        try:
-            tree = ET.parse(xml_file)
-            root = tree.getroot()
-
-            data_dict = xml_to_dict(root)
-
-            json_filename = os.path.splitext(os.path.basename(xml_file))[0] + ".json"
-            json_filepath = os.path.join(output_folder, json_filename)
-
-            with open(json_filepath, "w", encoding="utf-8") as json_file:
-                json.dump(data_dict, json_file, indent=4, ensure_ascii=False)
-
-            print(f"Converted: {xml_file} -> {json_filepath}")
-
-        except Exception as e:
-            print(f"Error processing {xml_file}: {e}")
+    # Like glob("*.xml"), skipping hidden files; scandir entries cache file type information
+    with os.scandir(input_folder) as entries:
+        xml_files = [
+            entry.path
+            for entry in entries
+            if entry.name.endswith(".xml")
+            and not entry.name.startswith(".")
+            and entry.is_file()
+        ]
+
+    # Send files to workers in batches, to reduce communication overhead
+    chunksize = max(1, len(xml_files) // (4 * (os.cpu_count() or 1)))
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(
+            _convert_one, xml_files, repeat(output_folder), chunksize=chunksize
+        )
+        for xml_file, json_filepath, error in results:
+            if error is None:
+                print(f"Converted: {xml_file} -> {json_filepath}")
+            else:
+                print(f"Error processing {xml_file}: {error}")
 
 
 if __name__ == "__main__":